@@ -0,0 +1,37 @@
+"""
+JSON encoding helpers for the OSM Data Client.
+
+Uses orjson when the optional ``fast`` extra is installed
+(``pip install raw-data-api-py[fast]``), otherwise the standard json module.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: str | bytes) -> Any:
+    """Decode a JSON document."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> str:
+    """
+    Encode an object as a compact JSON string.
+
+    Objects orjson cannot encode (e.g. dicts with non-string keys) are passed
+    to the standard json module instead. Note that orjson writes NaN and
+    Infinity as null, where the json module writes the non-standard NaN.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode()
+        except TypeError:
+            pass
+    return json.dumps(obj, separators=(",", ":"))
@@ -11,6 +11,7 @@ import json
 import sys
 import logging
 from pathlib import Path
+from typing import Any, Optional
 from importlib.metadata import version, PackageNotFoundError
 
 from .client import RawDataClient
@@ -46,6 +47,45 @@ def setup_logging(verbose: bool) -> None:
         log.debug("Verbose logging enabled")
 
 
+def parse_attribute_list(value: str) -> list[str]:
+    """
+    Parse a comma-separated list of attribute names.
+
+    Args:
+        value: Attribute names separated by commas, e.g. "name,addr:street"
+
+    Returns:
+        List of attribute names with surrounding whitespace removed
+
+    Raises:
+        argparse.ArgumentTypeError: If no attribute names are given
+    """
+    names = [name.strip() for name in value.split(",") if name.strip()]
+    if not names:
+        raise argparse.ArgumentTypeError("expected at least one attribute name")
+    return names
+
+
+def build_filters(
+    feature_type: str, keep_attrs: Optional[list[str]] = None
+) -> dict[str, Any]:
+    """
+    Build the request filters for a feature type.
+
+    Args:
+        feature_type: OSM tag key to download, e.g. "building"
+        keep_attrs: Attributes to include, or None to include all
+
+    Returns:
+        Filters dictionary for the API request
+    """
+    filters = {"tags": {"all_geometry": {feature_type: []}}}
+    if keep_attrs is not None:
+        # Let the API drop unused properties before they are sent
+        filters["attributes"] = {"all_geometry": keep_attrs}
+    return filters
+
+
 async def run_cli(args: argparse.Namespace) -> int:
     """
     Execute the CLI command.
@@ -85,7 +125,7 @@ async def run_cli(args: argparse.Namespace) -> int:
             "outputType": args.format,
             "fileName": Path(args.out).stem,
             "bindZip": not no_zip,
-            "filters": {"tags": {"all_geometry": {args.feature_type: []}}},
+            "filters": build_filters(args.feature_type, args.keep_attrs),
         }
 
         # Configure the client
@@ -126,10 +166,13 @@ async def run_cli(args: argparse.Namespace) -> int:
         return 1
 
 
-def main() -> int:
+def main(argv: Optional[list[str]] = None) -> int:
     """
     Main entry point for the CLI.
 
+    Args:
+        argv: Command-line arguments, defaults to sys.argv[1:]
+
     Returns:
         Exit code
     """
@@ -167,6 +210,13 @@ def main() -> int:
         "--feature-type", default="building", help="Type of feature to download"
     )
 
+    parser.add_argument(
+        "--keep-attrs",
+        type=parse_attribute_list,
+        metavar="ATTRS",
+        help="Comma-separated list of attributes to include (default: all)",
+    )
+
     parser.add_argument(
         "--out",
         type=Path,
@@ -211,7 +261,7 @@ def main() -> int:
     )
 
     # Parse arguments
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Set up logging
     setup_logging(args.verbose)
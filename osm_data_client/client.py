@@ -1,8 +1,12 @@
 import logging
 import asyncio
-import json
-from typing import Any
-from aiohttp import ClientSession, ClientResponseError
+import math
+import random
+import warnings
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Optional
+from aiohttp import ClientSession, ClientResponseError, TCPConnector
 
 from .models import (
     GeometryInput,
@@ -11,15 +15,81 @@ from .models import (
     RawDataOutputOptions,
     RawDataClientConfig,
 )
+from . import _json
 from .exceptions import APIRequestError, TaskPollingError, DownloadError
 from .processing import OutputProcessor, RawDataResult
 
 
 log = logging.getLogger(__name__)
 
+# Task states after which polling stops
+_TERMINAL_STATUSES = frozenset({"SUCCESS", "FAILED"})
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Convert a Retry-After header (seconds or HTTP date) to seconds."""
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        pass
+    else:
+        if not math.isfinite(seconds):
+            log.debug("Ignoring non-finite Retry-After header: %s", value)
+            return None
+        return max(0.0, seconds)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        log.debug("Ignoring unparseable Retry-After header: %s", value)
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _poll_delay(
+    backoff: float,
+    max_interval: float,
+    eta: Any = None,
+    retry_after: Optional[float] = None,
+) -> float:
+    """
+    Compute the wait before the next polling attempt.
+
+    Args:
+        backoff: Current backoff step in seconds, before jitter
+        max_interval: Upper bound in seconds for the computed wait
+        eta: Estimated seconds to completion reported by the API, if any
+        retry_after: Seconds requested by a Retry-After header, if any
+
+    Returns:
+        Seconds to wait. A Retry-After value is returned unchanged; otherwise
+        the result never exceeds max_interval. An eta-based wait is never
+        shorter than the current backoff step.
+    """
+    if retry_after is not None:
+        return retry_after
+    if isinstance(eta, (int, float)) and not isinstance(eta, bool) and eta > 0:
+        return max(backoff, min(max_interval, eta / 2))
+    return min(max_interval, backoff * random.uniform(0.8, 1.2))
+
 
 class RawDataAPI:
-    """Client for the HOTOSM Raw Data API."""
+    """
+    Client for the HOTOSM Raw Data API.
+
+    A single HTTP session is shared by every request made while the client is
+    used as an async context manager, so the snapshot request, task polling and
+    download reuse pooled keep-alive connections. Methods called outside of the
+    context manager open a session for the duration of the call.
+
+    Examples:
+        >>> async with RawDataAPI(config) as api:
+        ...     task = await api.request_snapshot(geometry, params)
+        ...     result = await api.poll_task_status(task["track_link"])
+    """
 
     def __init__(self, config: RawDataClientConfig = RawDataClientConfig.default()):
         """
@@ -31,7 +101,6 @@ class RawDataAPI:
         self.config = config
         self.headers = {
             "accept": "application/json",
-            "Content-Type": "application/json",
             "Referer": "raw-data-client-py",
         }
 
@@ -39,6 +108,31 @@ class RawDataAPI:
             self.headers["Authorization"] = f"Bearer {config.access_token}"
             log.debug("Using access token for authentication")
 
+        self._session: Optional[ClientSession] = None
+        self._session_users = 0
+
+    async def __aenter__(self) -> "RawDataAPI":
+        """Open the shared HTTP session, or reuse it if already open."""
+        if self._session is None or self._session.closed:
+            log.debug("Opening shared HTTP session")
+            self._session = ClientSession(
+                connector=TCPConnector(
+                    limit=0, ttl_dns_cache=300, keepalive_timeout=60
+                ),
+                headers=self.headers,
+                json_serialize=_json.dumps,
+            )
+        self._session_users += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Close the shared HTTP session once the outermost context exits."""
+        self._session_users -= 1
+        if self._session_users == 0 and self._session is not None:
+            session, self._session = self._session, None
+            log.debug("Closing shared HTTP session")
+            await session.close()
+
     async def request_snapshot(
         self, geometry: GeometryInput, params: RequestParams
     ) -> dict[str, Any]:
@@ -60,16 +154,15 @@ class RawDataAPI:
             "geometry": geometry.to_dict(),
         }
 
-        log.debug("Requesting snapshot with params: %s", json.dumps(payload))
+        log.debug("Requesting snapshot with params: %s", payload)
 
-        async with ClientSession() as session:
+        async with self:
             try:
-                async with session.post(
+                async with self._session.post(
                     f"{self.config.base_api_url}/snapshot/",
-                    data=json.dumps(payload),
-                    headers=self.headers,
+                    json=payload,
                 ) as response:
-                    response_data = await response.json()
+                    response_data = await response.json(loads=_json.loads)
                     if response.status >= 400:
                         log.error(
                             "API request failed with status %d: %s",
@@ -114,16 +207,15 @@ class RawDataAPI:
             "geometry": geometry.to_dict(),
         }
 
-        log.debug("Requesting snapshot with params: %s", json.dumps(payload))
+        log.debug("Requesting snapshot with params: %s", payload)
 
-        async with ClientSession() as session:
+        async with self:
             try:
-                async with session.post(
+                async with self._session.post(
                     f"{self.config.base_api_url}/snapshot/plain/",
                     json=payload,
-                    headers=self.headers,
                 ) as response:
-                    response_data = await response.json()
+                    response_data = await response.json(loads=_json.loads)
                     if response.status >= 400:
                         log.error(
                             "API request failed with status %d: %s",
@@ -148,14 +240,30 @@ class RawDataAPI:
                 raise APIRequestError(0, {}, str(ex)) from ex
 
     async def poll_task_status(
-        self, task_link: str, polling_interval: int = 2
+        self,
+        task_link: str,
+        polling_interval: Optional[float] = None,
+        *,
+        initial: float = 0.25,
+        max_interval: float = 30.0,
+        factor: float = 1.7,
     ) -> dict[str, Any]:
         """
         Poll the API to check task status until completion.
 
+        The wait between attempts grows exponentially (with jitter) from
+        `initial` up to `max_interval` seconds. An `eta` reported by the API
+        takes precedence over the computed delay. A `Retry-After` header is
+        honoured as is, including on 429 and 503 responses, which are retried
+        instead of failing.
+
         Args:
             task_link: Task tracking URL
-            polling_interval: Seconds between polling attempts
+            polling_interval: Deprecated. Fixed seconds between polling
+                attempts; use `initial`, `max_interval` and `factor` instead
+            initial: Seconds to wait before the second polling attempt
+            max_interval: Upper bound in seconds for the computed wait
+            factor: Multiplier applied to the wait after each attempt
 
         Returns:
             Task status details
@@ -163,20 +271,45 @@ class RawDataAPI:
         Raises:
             TaskPollingError: If polling fails
         """
+        if polling_interval is not None:
+            warnings.warn(
+                "polling_interval is deprecated, use initial, max_interval "
+                "and factor instead",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            initial = max_interval = polling_interval
+            factor = 1.0
+
         log.info("Starting task polling: %s", task_link)
 
         # Track previous status to log changes
         previous_status = None
+        backoff = initial
 
-        async with ClientSession() as session:
+        async with self:
             while True:
                 try:
-                    async with session.get(
+                    async with self._session.get(
                         url=f"{self.config.base_api_url}{task_link}",
-                        headers=self.headers,
                     ) as response:
+                        retry_after = _parse_retry_after(
+                            response.headers.get("Retry-After")
+                        )
+                        if response.status in (429, 503) and retry_after is not None:
+                            log.info(
+                                "Polling throttled with status %d, retrying in "
+                                "%.2f seconds",
+                                response.status,
+                                retry_after,
+                            )
+                            # Read the body so the connection returns to the pool
+                            await response.read()
+                            await asyncio.sleep(retry_after)
+                            continue
+
                         if response.status >= 400:
-                            response_data = await response.json()
+                            response_data = await response.json(loads=_json.loads)
                             log.error(
                                 "Polling failed with status %d: %s",
                                 response.status,
@@ -186,7 +319,7 @@ class RawDataAPI:
                                 f"Polling failed with status {response.status}: {response_data}"
                             )
 
-                        result = await response.json()
+                        result = await response.json(loads=_json.loads)
                         current_status = result.get("status")
 
                         # Log status changes
@@ -194,7 +327,7 @@ class RawDataAPI:
                             log.info("Task status: %s", current_status)
                             previous_status = current_status
 
-                        if current_status in ["SUCCESS", "FAILED"]:
+                        if current_status in _TERMINAL_STATUSES:
                             if current_status == "FAILED":
                                 error_msg = result.get("result", {}).get(
                                     "error_msg", "Unknown error"
@@ -204,11 +337,13 @@ class RawDataAPI:
                                 log.info("Task completed successfully")
                             return result
 
-                        log.debug(
-                            "Task still processing, waiting %d seconds",
-                            polling_interval,
+                        delay = _poll_delay(
+                            backoff, max_interval, result.get("eta"), retry_after
                         )
-                        await asyncio.sleep(polling_interval)
+
+                    backoff = min(max_interval, backoff * factor)
+                    log.debug("Task still processing, waiting %.2f seconds", delay)
+                    await asyncio.sleep(delay)
                 except TaskPollingError:
                     raise
                 except Exception as ex:
@@ -242,10 +377,8 @@ class RawDataAPI:
         log.info("Downloading data to %s (%s bytes)", file_path, data.size_bytes)
 
         try:
-            async with ClientSession() as session:
-                async with session.get(
-                    data.download_url, headers=self.headers
-                ) as response:
+            async with self:
+                async with self._session.get(data.download_url) as response:
                     if response.status >= 400:
                         log.error("Download failed with status %d", response.status)
                         raise DownloadError(
@@ -347,35 +480,37 @@ class RawDataClient:
             log.info("Requesting OSM geojson data snapshot")
             return await self.api.request_plain_geojson_snapshot(geometry_input, params)
 
-        # Request snapshot
-        log.info("Requesting OSM data snapshot for %s", params.file_name)
-        task_response = await self.api.request_snapshot(geometry_input, params)
-
-        # Get task link for polling
-        task_link = task_response.get("track_link")
-        if not task_link:
-            raise TaskPollingError("No task link found in API response")
-
-        # Poll for task completion
-        result = await self.api.poll_task_status(task_link)
-
-        if result["status"] != "SUCCESS":
-            # Handle failure
-            error_msg = f"Task failed with status: {result['status']}"
-            if result.get("result", {}).get("error_msg"):
-                error_msg += f" - {result['result']['error_msg']}"
-            raise DownloadError(error_msg)
-
-        # Create metadata from the result
-        metadata = RawDataApiMetadata.from_api_result(result, params)
-        log.debug("Data metadata: %s", metadata)
-
-        if output_options.download_file:
-            # Download the data
-            return await self.api.download_to_disk(metadata, output_options)
-
-        # Skip download and return directly
-        return RawDataResult(metadata=metadata, data=result.get("result", {}))
+        # Share one HTTP session across request, polling and download
+        async with self.api:
+            # Request snapshot
+            log.info("Requesting OSM data snapshot for %s", params.file_name)
+            task_response = await self.api.request_snapshot(geometry_input, params)
+
+            # Get task link for polling
+            task_link = task_response.get("track_link")
+            if not task_link:
+                raise TaskPollingError("No task link found in API response")
+
+            # Poll for task completion
+            result = await self.api.poll_task_status(task_link)
+
+            if result["status"] != "SUCCESS":
+                # Handle failure
+                error_msg = f"Task failed with status: {result['status']}"
+                if result.get("result", {}).get("error_msg"):
+                    error_msg += f" - {result['result']['error_msg']}"
+                raise DownloadError(error_msg)
+
+            # Create metadata from the result
+            metadata = RawDataApiMetadata.from_api_result(result, params)
+            log.debug("Data metadata: %s", metadata)
+
+            if output_options.download_file:
+                # Download the data
+                return await self.api.download_to_disk(metadata, output_options)
+
+            # Skip download and return directly
+            return RawDataResult(metadata=metadata, data=result.get("result", {}))
 
 
 async def get_osm_data(
@@ -5,6 +5,8 @@ from dataclasses import dataclass
 from enum import Enum, auto
 from pathlib import Path
 
+from .exceptions import ValidationError
+
 log = logging.getLogger(__name__)
 
 
@@ -15,7 +17,7 @@ class FilterDict(TypedDict, total=False):
     attributes: dict[str, list[str]]
 
 
-@dataclass
+@dataclass(slots=True)
 class GeometryInput:
     """Validated geometry input for OSM API requests."""
 
@@ -36,8 +38,6 @@ class GeometryInput:
         Raises:
             ValidationError: If geometry is invalid
         """
-        from .exceptions import ValidationError
-
         if isinstance(geometry, str):
             try:
                 geometry_dict = json.loads(geometry)
@@ -126,7 +126,23 @@ class GeometryInput:
         return {"type": self.type, "coordinates": self.coordinates}
 
 
-@dataclass
+# Keyword arguments accepted in camelCase (as sent to the API) and their
+# snake_case RequestParams field names
+_API_KEY_MAP = {
+    "fileName": "file_name",
+    "outputType": "output_type",
+    "geometryType": "geometry_type",
+    "bindZip": "bind_zip",
+}
+
+
+# Formats the API can return without ZIP packaging
+_STREAMING_COMPATIBLE_FORMATS = frozenset(
+    {"geojson", "cog", "fgb"}  # Cloud Optimized GeoTIFF, FlatGeoBuf
+)
+
+
+@dataclass(slots=True)
 class RequestParams:
     """Validated parameters for OSM API requests."""
 
@@ -138,16 +154,18 @@ class RequestParams:
     filters: Optional[FilterDict] = None
     geometry_type: Optional[list[str]] = None
 
-    VALID_OUTPUT_TYPES = [
-        "geojson",
-        "shp",
-        "kml",
-        "mbtiles",
-        "flatgeobuf",
-        "csv",
-        "geopackage",
-        "pgdump",
-    ]
+    VALID_OUTPUT_TYPES = frozenset(
+        {
+            "geojson",
+            "shp",
+            "kml",
+            "mbtiles",
+            "flatgeobuf",
+            "csv",
+            "geopackage",
+            "pgdump",
+        }
+    )
 
     @classmethod
     def from_kwargs(cls, **kwargs) -> "RequestParams":
@@ -163,20 +181,8 @@ class RequestParams:
         Raises:
             ValidationError: If parameters are invalid
         """
-        from .exceptions import ValidationError
-
         # Convert to snake_case internally
-        params = {}
-        if "fileName" in kwargs:
-            params["file_name"] = kwargs.pop("fileName")
-        if "outputType" in kwargs:
-            params["output_type"] = kwargs.pop("outputType")
-        if "geometryType" in kwargs:
-            params["geometry_type"] = kwargs.pop("geometryType")
-        if "bindZip" in kwargs:
-            params["bind_zip"] = kwargs.pop("bindZip")
-
-        params.update(kwargs)
+        params = {_API_KEY_MAP.get(key, key): value for key, value in kwargs.items()}
 
         if "output_type" in params and "bind_zip" in params:
             params["bind_zip"] = RequestParams.validate_bind_zip_compatibility(
@@ -187,7 +193,9 @@ class RequestParams:
 
         if instance.output_type not in cls.VALID_OUTPUT_TYPES:
             log.error("Invalid output type: %s", instance.output_type)
-            raise ValidationError(f"outputType must be one of {cls.VALID_OUTPUT_TYPES}")
+            raise ValidationError(
+                f"outputType must be one of {sorted(cls.VALID_OUTPUT_TYPES)}"
+            )
 
         return instance
 
@@ -213,13 +221,7 @@ class RequestParams:
     @staticmethod
     def validate_bind_zip_compatibility(output_type, bind_zip):
         """Validate if the output format is compatible with bindZip=False"""
-        streaming_compatible_formats = [
-            "geojson",
-            "cog",
-            "fgb",
-        ]  # Cloud Optimized GeoTIFF, FlatGeoBuf
-
-        if not bind_zip and output_type.lower() not in streaming_compatible_formats:
+        if not bind_zip and output_type.lower() not in _STREAMING_COMPATIBLE_FORMATS:
             log.warning(
                 f"Format '{output_type}' requires ZIP packaging. "
                 f"Automatically setting bindZip=True"
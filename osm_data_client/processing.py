@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from pathlib import Path
+import asyncio
 import logging
 import zipfile
 import json
@@ -10,6 +11,40 @@ from .exceptions import DownloadError
 
 log = logging.getLogger(__name__)
 
+# File extension of the main data file for each output format, where it
+# differs from the format name
+_FORMAT_EXTENSIONS = {
+    "flatgeobuf": ".fgb",
+    "geopackage": ".gpkg",
+    "pgdump": ".sql",
+}
+
+
+def _data_file_extension(format_ext: str) -> str:
+    """Get the file extension of the main data file for an output format."""
+    format_ext = format_ext.lower()
+    return _FORMAT_EXTENSIONS.get(format_ext, f".{format_ext}")
+
+
+def _classify_member(file_name: str, target_ext: str) -> Optional[str]:
+    """
+    Classify a zip archive member for single-file extraction.
+
+    Args:
+        file_name: Name of the member in the archive
+        target_ext: Extension of the main data file, from `_data_file_extension`
+
+    Returns:
+        "data" for the main data file, "metadata" for a JSON metadata file,
+        or None if the member should be skipped
+    """
+    name = file_name.lower()
+    if name.endswith(target_ext):
+        return "data"
+    if name.endswith(".json"):
+        return "metadata"
+    return None
+
 
 @dataclass
 class RawDataResult:
@@ -187,6 +222,29 @@ class OutputProcessor:
         """
         Extract using Python's standard zipfile module.
 
+        The extraction is blocking, so it runs in a worker thread to keep the
+        event loop free for other requests.
+
+        Args:
+            zip_path: Path to the zip file
+            metadata: Data metadata
+
+        Returns:
+            RawDataResult with extraction information
+
+        Raises:
+            DownloadError: If extraction fails
+        """
+        return await asyncio.to_thread(
+            self._extract_with_zipfile_sync, zip_path, metadata
+        )
+
+    def _extract_with_zipfile_sync(
+        self, zip_path: Path, metadata: RawDataApiMetadata
+    ) -> RawDataResult:
+        """
+        Synchronous implementation of `_extract_with_zipfile`.
+
         Args:
             zip_path: Path to the zip file
             metadata: Data metadata
@@ -223,36 +281,34 @@ class OutputProcessor:
 
             # For single-file formats, extract directly
             with zipfile.ZipFile(str(zip_path), "r") as zip_ref:
-                file_list = zip_ref.namelist()
-                log.debug("Zip contains: %s", file_list)
-
-                # Find the main data file by extension
-                target_ext = f".{metadata.format_ext.lower()}"
-                main_files = [f for f in file_list if f.lower().endswith(target_ext)]
-
-                if not main_files:
-                    log.error("No %s file found in zip", metadata.format_ext)
-                    raise DownloadError(
-                        f"No {metadata.format_ext} file found in zip archive"
-                    )
+                # Find the main data file by extension and the metadata file
+                # in a single pass over the archive's central directory
+                target_ext = _data_file_extension(metadata.format_ext)
+                main_info = None
+                metadata_info = None
+
+                for info in zip_ref.infolist():
+                    if info.is_dir():
+                        continue
+                    kind = _classify_member(info.filename, target_ext)
+                    if kind == "data" and main_info is None:
+                        main_info = info
+                    elif kind == "metadata" and metadata_info is None:
+                        metadata_info = info
+
+                if main_info is None:
+                    log.error("No %s file found in zip", target_ext)
+                    raise DownloadError(f"No {target_ext} file found in zip archive")
 
                 # Extract the main file
-                main_file = main_files[0]
-                main_file_path = Path(zip_ref.extract(main_file, str(output_directory)))
+                main_file_path = Path(zip_ref.extract(main_info, str(output_directory)))
                 extracted_files.append(main_file_path)
-                log.info("Extracted %s from zip", main_file)
+                log.info("Extracted %s from zip", main_info.filename)
 
                 # Extract metadata file if exists
-                metadata_files = [
-                    f
-                    for f in file_list
-                    if f.lower().endswith(".json") and f.lower() != main_file.lower()
-                ]
-
-                if metadata_files:
-                    metadata_file = metadata_files[0]
+                if metadata_info is not None:
                     metadata_path = Path(
-                        zip_ref.extract(metadata_file, str(output_directory))
+                        zip_ref.extract(metadata_info, str(output_directory))
                     )
                     extracted_files.append(metadata_path)
                     log.debug("Extracted metadata file: %s", metadata_path)
@@ -326,7 +382,7 @@ class OutputProcessor:
             # Prepare a file list to track what we extract
             extracted_files = []
             main_file_path = None
-            target_ext = f".{metadata.format_ext.lower()}"
+            target_ext = _data_file_extension(metadata.format_ext)
 
             # Create a properly async file reader
             async def zip_file_chunks():
@@ -355,19 +411,15 @@ class OutputProcessor:
                             file_size,
                         )
 
-                        # Determine if we should extract this file
-                        should_extract = False
-
-                        # For shapefiles, extract all files
-                        if metadata.format_ext.lower() == "shp":
-                            should_extract = True
-                        # For main file type, extract it
-                        elif file_name.lower().endswith(target_ext):
-                            should_extract = True
+                        # Determine if we should extract this file. For
+                        # shapefiles, extract all files; otherwise only the
+                        # main data file and metadata files
+                        kind = _classify_member(file_name, target_ext)
+                        if kind == "data":
                             main_file_candidates.append(file_name)
-                        # For metadata files, extract them too
-                        elif file_name.lower().endswith(".json"):
-                            should_extract = True
+                        should_extract = (
+                            metadata.format_ext.lower() == "shp" or kind is not None
+                        )
 
                         if should_extract:
                             # Calculate output path and create parent directories
@@ -383,7 +435,7 @@ class OutputProcessor:
                             extract_count += 1
 
                             # If this is the main file, track it
-                            if file_name.lower().endswith(target_ext):
+                            if kind == "data" and main_file_path is None:
                                 main_file_path = output_path
                         else:
                             # Skip this file's content
@@ -4,21 +4,32 @@ File utility functions for the OSM Data Client.
 This module provides utility functions for working with files
 """
 
-import json
 import logging
+from collections.abc import Iterable, Iterator
 from typing import Any
 from pathlib import Path
 
+from .. import _json
+
 log = logging.getLogger(__name__)
 
+NDJSON_SUFFIXES = (".geojsonl", ".ndjson")
+
 
-def save_to_geojson(data: dict[str, Any], file_path: str) -> Path:
+def save_to_geojson(
+    data: dict[str, Any] | Iterable[dict[str, Any]], file_path: str | Path
+) -> Path:
     """
     Save GeoJSON data to a file.
 
+    Features are serialized and written one at a time, so `data` may be an
+    iterator of features (e.g. from `iter_geojson_features`) that is never
+    held in memory as a whole. Paths ending in `.geojsonl` or `.ndjson` are
+    written as newline-delimited GeoJSON, one feature per line.
+
     Args:
-        data: GeoJSON data to save
-        file_path: Path to save the file
+        data: GeoJSON object, or an iterable of GeoJSON features
+        file_path: Path to save the file, as a string or Path
 
     Returns:
         Path to the saved file
@@ -28,8 +39,74 @@ def save_to_geojson(data: dict[str, Any], file_path: str) -> Path:
 
     path.parent.mkdir(parents=True, exist_ok=True)
 
+    if isinstance(data, dict):
+        if "features" not in data:
+            # A single geometry or feature, nothing to stream
+            with path.open("w", encoding="utf-8") as f:
+                f.write(_json.dumps(data))
+            log.debug("GeoJSON data saved successfully")
+            return path
+        members = {key: value for key, value in data.items() if key != "features"}
+        features = data["features"]
+    else:
+        members = {"type": "FeatureCollection"}
+        features = data
+
+    count = 0
     with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f)
+        if path.suffix.lower() in NDJSON_SUFFIXES:
+            for feature in features:
+                f.write(_json.dumps(feature))
+                f.write("\n")
+                count += 1
+        else:
+            f.write("{")
+            for key, value in members.items():
+                f.write(f"{_json.dumps(key)}:{_json.dumps(value)},")
+            f.write('"features":[')
+            for feature in features:
+                if count:
+                    f.write(",")
+                f.write(_json.dumps(feature))
+                count += 1
+            f.write("]}")
 
-    log.debug("GeoJSON data saved successfully")
+    log.debug("GeoJSON data saved successfully (%d features)", count)
     return path
+
+
+def iter_geojson_features(file_path: str | Path) -> Iterator[dict[str, Any]]:
+    """
+    Iterate over the features of a GeoJSON FeatureCollection file.
+
+    Newline-delimited files (`.geojsonl`, `.ndjson`) are read line by line.
+    For regular GeoJSON, when ijson is installed the file is parsed
+    incrementally, so only one feature is held in memory at a time.
+    Otherwise the whole file is loaded into memory.
+
+    Args:
+        file_path: Path to the GeoJSON file
+
+    Yields:
+        GeoJSON feature dictionaries
+    """
+    path = Path(file_path)
+
+    if path.suffix.lower() in NDJSON_SUFFIXES:
+        with path.open("r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield _json.loads(line)
+        return
+
+    try:
+        import ijson
+    except ImportError:
+        log.debug("ijson not installed, loading %s into memory", path)
+        with path.open("r", encoding="utf-8") as f:
+            yield from _json.loads(f.read()).get("features", [])
+        return
+
+    log.debug("Streaming GeoJSON features from %s", path)
+    with path.open("rb") as f:
+        yield from ijson.items(f, "features.item", use_float=True)
@@ -1,11 +1,14 @@
 import os
 import json
+import logging
 import subprocess
 import shutil
 import sys
 import pytest
 from pathlib import Path
 
+from osm_data_client.cli import build_filters, main, parse_attribute_list
+
 BASE_DIR = Path(__file__).parent
 TEST_DIR = BASE_DIR / "test_data"
 OUTPUT_DIR = TEST_DIR / "output"
@@ -62,16 +65,42 @@ class TestCliIntegration:
             print(f"Cleaning up test output directory: {OUTPUT_DIR}")
             shutil.rmtree(OUTPUT_DIR)
 
-    def run_cli_command(self, args, check=True):
-        """Helper method to run CLI commands with improved error handling."""
-        python_exe = sys.executable
-
-        # Create the full command
-        cmd = [python_exe, "-m", "osm_data_client.cli"] + args
-        print(f"Running command: {' '.join(cmd)}")
+    @pytest.fixture(autouse=True)
+    def _capture(self, capsys):
+        """Make captured stdout/stderr available to run_cli_command."""
+        self.capsys = capsys
 
-        # Run the command
-        result = subprocess.run(cmd, capture_output=True, text=True)
+    def run_cli_command(self, args, check=True):
+        """Helper method to run the CLI in-process with improved error handling."""
+        self.capsys.readouterr()
+        print(f"Running command: osm_data_client.cli {' '.join(args)}")
+
+        # basicConfig only takes effect on a root logger without handlers,
+        # so detach pytest's handlers while the CLI runs and restore them
+        root_logger = logging.getLogger()
+        saved_handlers = root_logger.handlers[:]
+        saved_level = root_logger.level
+        root_logger.handlers.clear()
+
+        try:
+            returncode = main(args)
+        except SystemExit as ex:
+            # argparse exits directly on usage errors; match the exit status
+            # a subprocess would report for each SystemExit code
+            if ex.code is None:
+                returncode = 0
+            elif isinstance(ex.code, int):
+                returncode = ex.code
+            else:
+                returncode = 1
+        finally:
+            root_logger.handlers[:] = saved_handlers
+            root_logger.setLevel(saved_level)
+
+        captured = self.capsys.readouterr()
+        result = subprocess.CompletedProcess(
+            args, returncode, captured.out, captured.err
+        )
 
         # Log output for debugging
         print(f"STDOUT: {result.stdout}")
@@ -86,6 +115,14 @@ class TestCliIntegration:
 
         return result
 
+    def test_cli_help(self):
+        """Test that the CLI module runs as a script and prints its usage."""
+        cmd = [sys.executable, "-m", "osm_data_client.cli", "--help"]
+        result = subprocess.run(cmd, capture_output=True, text=True)
+
+        assert result.returncode == 0
+        assert "--bounds" in result.stdout
+
     def test_cli_version(self):
         """Test the CLI version command."""
         result = self.run_cli_command(["--version"])
@@ -101,6 +138,15 @@ class TestCliIntegration:
         assert result.returncode != 0
         assert "--geojson" in result.stderr and "--bounds" in result.stderr
 
+    def test_empty_keep_attrs(self):
+        """Test that an empty --keep-attrs is rejected."""
+        result = self.run_cli_command(
+            ["--bounds", *map(str, TINY_BBOX), "--keep-attrs", " , "], check=False
+        )
+
+        assert result.returncode == 2
+        assert "--keep-attrs" in result.stderr
+
     @pytest.mark.skipif(
         os.environ.get("SKIP_API_TESTS") == "1",
         reason="Skipping tests that require API access",
@@ -343,3 +389,26 @@ class TestCliIntegration:
         file_size = output_file.stat().st_size
         assert file_size > 0, f"Output file {output_file} is empty (0 bytes)"
         print(f"Downloaded file size: {file_size} bytes")
+
+
+class TestCliFilters:
+    """Tests for building request filters from CLI arguments."""
+
+    def test_parse_attribute_list(self):
+        """Test that attribute names are split and stripped."""
+        assert parse_attribute_list("name, addr:street ,,height") == [
+            "name",
+            "addr:street",
+            "height",
+        ]
+
+    def test_filters_without_attributes(self):
+        """Test that all attributes are kept when none are given."""
+        assert build_filters("building") == {"tags": {"all_geometry": {"building": []}}}
+
+    def test_filters_with_attributes(self):
+        """Test that --keep-attrs becomes the attributes filter."""
+        assert build_filters("building", ["name", "addr:street"]) == {
+            "tags": {"all_geometry": {"building": []}},
+            "attributes": {"all_geometry": ["name", "addr:street"]},
+        }
@@ -0,0 +1,141 @@
+import json
+import sys
+
+import pytest
+
+from osm_data_client.utils.file import iter_geojson_features, save_to_geojson
+
+FEATURES = [
+    {
+        "type": "Feature",
+        "geometry": {"type": "Point", "coordinates": [-73.98, 40.75]},
+        "properties": {"name": "A", "height": 12.5},
+    },
+    {
+        "type": "Feature",
+        "geometry": {"type": "Point", "coordinates": [-73.97, 40.76]},
+        "properties": {"name": "B", "height": None},
+    },
+]
+
+
+class TestSaveToGeojson:
+    """Tests for writing GeoJSON files."""
+
+    def test_dict_input(self, tmp_path):
+        """Test writing a FeatureCollection dict."""
+        path = save_to_geojson(
+            {"type": "FeatureCollection", "features": FEATURES},
+            tmp_path / "out.geojson",
+        )
+
+        assert json.loads(path.read_text()) == {
+            "type": "FeatureCollection",
+            "features": FEATURES,
+        }
+
+    def test_iterator_input(self, tmp_path):
+        """Test that an iterator of features is wrapped in a FeatureCollection."""
+        path = save_to_geojson(iter(FEATURES), tmp_path / "out.geojson")
+
+        assert json.loads(path.read_text()) == {
+            "type": "FeatureCollection",
+            "features": FEATURES,
+        }
+
+    def test_empty_iterator(self, tmp_path):
+        """Test that no features gives an empty FeatureCollection."""
+        path = save_to_geojson(iter([]), tmp_path / "out.geojson")
+
+        assert json.loads(path.read_text()) == {
+            "type": "FeatureCollection",
+            "features": [],
+        }
+
+    def test_non_feature_collection(self, tmp_path):
+        """Test that a dict without features is written unchanged."""
+        geometry = {"type": "Point", "coordinates": [-73.98, 40.75]}
+
+        path = save_to_geojson(geometry, tmp_path / "out.geojson")
+
+        assert json.loads(path.read_text()) == geometry
+
+    def test_extra_members_kept(self, tmp_path):
+        """Test that top-level members other than features are preserved."""
+        data = {
+            "type": "FeatureCollection",
+            "name": "buildings",
+            "bbox": [-73.98, 40.75, -73.97, 40.76],
+            "features": FEATURES,
+        }
+
+        path = save_to_geojson(data, tmp_path / "out.geojson")
+
+        assert json.loads(path.read_text()) == data
+
+    def test_creates_parent_directories(self, tmp_path):
+        """Test that missing parent directories are created."""
+        path = save_to_geojson(iter(FEATURES), tmp_path / "a" / "b" / "out.geojson")
+
+        assert path.exists()
+
+    @pytest.mark.parametrize("suffix", [".geojsonl", ".ndjson"])
+    def test_newline_delimited(self, tmp_path, suffix):
+        """Test that NDJSON paths get one feature per line."""
+        path = save_to_geojson(
+            {"type": "FeatureCollection", "features": FEATURES},
+            tmp_path / f"out{suffix}",
+        )
+
+        lines = path.read_text().splitlines()
+        assert [json.loads(line) for line in lines] == FEATURES
+
+
+class TestIterGeojsonFeatures:
+    """Tests for reading GeoJSON files one feature at a time."""
+
+    @pytest.fixture(params=["ijson", "json"])
+    def parser(self, request, monkeypatch):
+        """Run with ijson streaming and with the json fallback."""
+        if request.param == "ijson":
+            pytest.importorskip("ijson")
+        else:
+            monkeypatch.setitem(sys.modules, "ijson", None)
+        return request.param
+
+    def test_round_trip(self, tmp_path, parser):
+        """Test reading back a file written by save_to_geojson."""
+        path = save_to_geojson(iter(FEATURES), tmp_path / "out.geojson")
+
+        assert list(iter_geojson_features(path)) == FEATURES
+
+    def test_empty_collection(self, tmp_path, parser):
+        """Test that an empty FeatureCollection yields nothing."""
+        path = save_to_geojson(iter([]), tmp_path / "out.geojson")
+
+        assert list(iter_geojson_features(path)) == []
+
+    def test_returns_iterator(self, tmp_path, parser):
+        """Test that features are produced lazily."""
+        path = save_to_geojson(iter(FEATURES), tmp_path / "out.geojson")
+
+        features = iter_geojson_features(path)
+
+        assert next(features) == FEATURES[0]
+
+    @pytest.mark.parametrize("suffix", [".geojsonl", ".ndjson"])
+    def test_newline_delimited_round_trip(self, tmp_path, suffix):
+        """Test reading back a newline-delimited file."""
+        path = save_to_geojson(iter(FEATURES), tmp_path / f"out{suffix}")
+
+        assert list(iter_geojson_features(path)) == FEATURES
+
+    def test_stream_to_new_file(self, tmp_path):
+        """Test piping features from one file into another."""
+        source = save_to_geojson(iter(FEATURES), tmp_path / "in.geojson")
+
+        target = save_to_geojson(
+            iter_geojson_features(source), tmp_path / "out.geojsonl"
+        )
+
+        assert list(iter_geojson_features(target)) == FEATURES
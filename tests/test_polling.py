@@ -0,0 +1,150 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+from aiohttp import web
+
+from osm_data_client import RawDataAPI, RawDataClientConfig
+from osm_data_client.client import _parse_retry_after, _poll_delay
+from osm_data_client.exceptions import TaskPollingError
+
+TASK_LINK = "/tasks/status/test/"
+
+
+class TestRetryAfter:
+    """Tests for parsing the Retry-After header."""
+
+    def test_seconds(self):
+        """Test a delay given in seconds."""
+        assert _parse_retry_after("3") == 3.0
+        assert _parse_retry_after("1.5") == 1.5
+
+    def test_negative_seconds(self):
+        """Test that negative delays are clamped to zero."""
+        assert _parse_retry_after("-5") == 0.0
+
+    def test_http_date(self):
+        """Test a delay given as an HTTP date."""
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=60)
+        delay = _parse_retry_after(format_datetime(retry_at, usegmt=True))
+
+        assert 55 <= delay <= 60
+
+    def test_http_date_in_past(self):
+        """Test that a date in the past means no wait."""
+        assert _parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+    @pytest.mark.parametrize(
+        "value", [None, "", "soon", "Wed, 99 Foo", "inf", "1e400", "nan"]
+    )
+    def test_missing_or_garbage(self, value):
+        """Test that missing or unparseable values are ignored."""
+        assert _parse_retry_after(value) is None
+
+
+class TestPollDelay:
+    """Tests for computing the wait between polling attempts."""
+
+    def test_jitter_range(self):
+        """Test that jitter stays within 20% of the backoff step."""
+        for _ in range(100):
+            assert 0.8 <= _poll_delay(1.0, 30.0) <= 1.2
+
+    def test_capped_after_jitter(self):
+        """Test that the computed wait never exceeds max_interval."""
+        for _ in range(100):
+            assert _poll_delay(30.0, 30.0) <= 30.0
+
+    def test_eta_override(self):
+        """Test that a reported eta sets the wait to half of it."""
+        assert _poll_delay(0.25, 30.0, eta=10) == 5.0
+
+    def test_eta_capped(self):
+        """Test that an eta-based wait is capped at max_interval."""
+        assert _poll_delay(0.25, 30.0, eta=600) == 30.0
+
+    def test_eta_floor(self):
+        """Test that a small eta never polls faster than the backoff step."""
+        assert _poll_delay(2.0, 30.0, eta=0.01) == 2.0
+
+    @pytest.mark.parametrize("eta", [None, 0, -1, "10", True])
+    def test_invalid_eta_ignored(self, eta):
+        """Test that missing or invalid eta values fall back to backoff."""
+        assert 0.8 <= _poll_delay(1.0, 30.0, eta=eta) <= 1.2
+
+    def test_retry_after_used_verbatim(self):
+        """Test that Retry-After wins over eta and the cap."""
+        assert _poll_delay(0.25, 30.0, eta=10, retry_after=45.0) == 45.0
+
+
+class TestPollTaskStatus:
+    """Tests for polling against a local task status endpoint."""
+
+    @pytest.fixture
+    async def serve(self):
+        """Start a local server replying with the given (status, headers, body)."""
+        runners = []
+
+        async def start(responses):
+            calls = []
+
+            async def handler(request):
+                status, headers, body = responses[min(len(calls), len(responses) - 1)]
+                calls.append(request)
+                return web.json_response(body, status=status, headers=headers)
+
+            app = web.Application()
+            app.router.add_get(TASK_LINK, handler)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            runners.append(runner)
+            site = web.TCPSite(runner, "127.0.0.1", 0)
+            await site.start()
+            host, port = runner.addresses[0][:2]
+            config = RawDataClientConfig(base_api_url=f"http://{host}:{port}")
+            return RawDataAPI(config), calls
+
+        yield start
+
+        for runner in runners:
+            await runner.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_retries_when_throttled(self, serve):
+        """Test that 429 and 503 with Retry-After are retried, not raised."""
+        api, calls = await serve(
+            [
+                (429, {"Retry-After": "0"}, {"detail": "slow down"}),
+                (503, {"Retry-After": "0"}, {"detail": "busy"}),
+                (200, {}, {"id": "test", "status": "SUCCESS", "result": {}}),
+            ]
+        )
+
+        result = await api.poll_task_status(TASK_LINK, initial=0.01)
+
+        assert result["status"] == "SUCCESS"
+        assert len(calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_error_without_retry_after(self, serve):
+        """Test that other error responses still fail immediately."""
+        api, calls = await serve([(429, {}, {"detail": "slow down"})])
+
+        with pytest.raises(TaskPollingError, match="status 429"):
+            await api.poll_task_status(TASK_LINK, initial=0.01)
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_polling_interval_deprecated(self, serve):
+        """Test that the old polling_interval argument still works."""
+        api, _ = await serve(
+            [
+                (200, {}, {"id": "test", "status": "STARTED"}),
+                (200, {}, {"id": "test", "status": "SUCCESS", "result": {}}),
+            ]
+        )
+
+        with pytest.warns(DeprecationWarning, match="polling_interval"):
+            result = await api.poll_task_status(TASK_LINK, polling_interval=0.01)
+
+        assert result["status"] == "SUCCESS"
@@ -0,0 +1,91 @@
+import zipfile
+
+import pytest
+
+from osm_data_client import RawDataClientConfig
+from osm_data_client.models import (
+    AutoExtractOption,
+    RawDataApiMetadata,
+    RawDataOutputOptions,
+)
+from osm_data_client.processing import OutputProcessor
+
+
+def make_metadata(format_ext: str) -> RawDataApiMetadata:
+    """Build metadata for a zipped export in the given format."""
+    return RawDataApiMetadata(
+        task_id="test",
+        format_ext=format_ext,
+        timestamp="",
+        size_bytes=0,
+        file_name="export",
+        download_url="",
+        is_zipped=True,
+    )
+
+
+def make_zip(path, members: dict[str, bytes]):
+    """Write a zip archive with the given members."""
+    with zipfile.ZipFile(path, "w") as zf:
+        for name, data in members.items():
+            zf.writestr(name, data)
+    return path
+
+
+class TestZipExtraction:
+    """Tests for picking the main data file out of a zip archive."""
+
+    @pytest.fixture
+    def processor(self, tmp_path):
+        """Create a processor that always extracts."""
+        return OutputProcessor(
+            RawDataClientConfig(output_directory=tmp_path),
+            RawDataOutputOptions(auto_extract=AutoExtractOption.force_extract),
+        )
+
+    @pytest.fixture(params=["zipfile", "stream"])
+    def extract(self, request, processor):
+        """Run with both the zipfile and the stream-unzip extraction paths."""
+        if request.param == "zipfile":
+            return processor._extract_with_zipfile
+        return processor._extract_with_stream_unzip
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "format_ext, file_name",
+        [
+            ("geojson", "export.geojson"),
+            ("flatgeobuf", "export.fgb"),
+            ("geopackage", "export.gpkg"),
+            ("kml", "export.kml"),
+        ],
+    )
+    async def test_selects_data_file(self, tmp_path, extract, format_ext, file_name):
+        """Test that the data file is chosen by its format's extension."""
+        zip_path = make_zip(
+            tmp_path / "export.zip",
+            {
+                "Readme.txt": b"readme",
+                "clipping_boundary.json": b"{}",
+                file_name: b"data",
+            },
+        )
+
+        result = await extract(zip_path, make_metadata(format_ext))
+
+        assert result.extracted
+        assert result.path.name == file_name
+        assert result.path.read_bytes() == b"data"
+
+    @pytest.mark.asyncio
+    async def test_no_matching_file(self, tmp_path, processor):
+        """Test that an archive without the data file is kept zipped."""
+        zip_path = make_zip(
+            tmp_path / "export.zip",
+            {"Readme.txt": b"readme", "clipping_boundary.json": b"{}"},
+        )
+
+        result = await processor.process_download(zip_path, make_metadata("flatgeobuf"))
+
+        assert not result.extracted
+        assert result.path == zip_path
@@ -0,0 +1,118 @@
+import pytest
+from aiohttp import web
+
+from osm_data_client import RawDataAPI, RawDataClient, RawDataClientConfig
+
+GEOMETRY = {
+    "type": "Polygon",
+    "coordinates": [
+        [
+            [-73.9851, 40.7572],
+            [-73.9850, 40.7572],
+            [-73.9850, 40.7573],
+            [-73.9851, 40.7573],
+            [-73.9851, 40.7572],
+        ]
+    ],
+}
+GEOJSON = b'{"type":"FeatureCollection","features":[]}'
+
+
+@pytest.fixture
+async def serve(tmp_path):
+    """Start a local server implementing snapshot, task status and download."""
+    runners = []
+
+    async def start():
+        peers = []
+
+        async def snapshot(request):
+            peers.append(request.transport.get_extra_info("peername"))
+            return web.json_response({"track_link": "/tasks/status/test/"})
+
+        async def status(request):
+            peers.append(request.transport.get_extra_info("peername"))
+            return web.json_response(
+                {
+                    "id": "test",
+                    "status": "SUCCESS",
+                    "result": {
+                        "download_url": f"{request.url.origin()}/download/",
+                        "zip_file_size_bytes": len(GEOJSON),
+                    },
+                }
+            )
+
+        async def download(request):
+            peers.append(request.transport.get_extra_info("peername"))
+            return web.Response(body=GEOJSON)
+
+        app = web.Application()
+        app.router.add_post("/snapshot/", snapshot)
+        app.router.add_get("/tasks/status/test/", status)
+        app.router.add_get("/download/", download)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        runners.append(runner)
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        host, port = runner.addresses[0][:2]
+        config = RawDataClientConfig(
+            base_api_url=f"http://{host}:{port}", output_directory=tmp_path
+        )
+        return config, peers
+
+    yield start
+
+    for runner in runners:
+        await runner.cleanup()
+
+
+class TestSharedSession:
+    """Tests for sharing one HTTP session across API calls."""
+
+    @pytest.mark.asyncio
+    async def test_nested_contexts_share_session(self, serve):
+        """Test that nested entries share a session closed by the outermost exit."""
+        config, _ = await serve()
+        api = RawDataAPI(config)
+
+        async with api:
+            outer_session = api._session
+            async with api:
+                assert api._session is outer_session
+            assert api._session is outer_session
+            assert not outer_session.closed
+
+        assert api._session is None
+        assert outer_session.closed
+
+    @pytest.mark.asyncio
+    async def test_session_reopened(self, serve):
+        """Test that a new session is opened on the next entry."""
+        config, _ = await serve()
+        api = RawDataAPI(config)
+
+        async with api:
+            first_session = api._session
+
+        async with api:
+            assert api._session is not first_session
+            assert not api._session.closed
+
+        assert api._session is None
+
+    @pytest.mark.asyncio
+    async def test_get_osm_data_reuses_connection(self, serve):
+        """Test that request, polling and download share one connection."""
+        config, peers = await serve()
+        client = RawDataClient(config)
+
+        result = await client.get_osm_data(
+            GEOMETRY, fileName="session_test", outputType="geojson", bindZip=False
+        )
+
+        assert result.path.read_bytes() == GEOJSON
+        assert len(peers) == 3
+        assert len(set(peers)) == 1
+        assert client.api._session is None